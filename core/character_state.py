@@ -0,0 +1,33 @@
+from core.state_store import StateStore
+from models import rules
+
+PROFICIENCY_BONUS_KEY = "proficiency_bonus"
+
+def score_key(ability_name):
+    """Store key holding an ability's score, e.g. "Strength.score"."""
+    return f"{ability_name}.score"
+
+def modifier_key(ability_name):
+    """Store key holding an ability's derived modifier string, e.g. "Strength.modifier"."""
+    return f"{ability_name}.modifier"
+
+def create_character_store(model):
+    """
+    Builds a StateStore for a CharacterModel: one score key per ability with its modifier derived
+    from the rules tables, plus level with its derived proficiency bonus (PROFICIENCY_BONUS_KEY).
+    """
+    store = StateStore()
+    for ability_name in model.abilities_list:
+        store.set(score_key(ability_name), model.ability_scores[ability_name]["score"])
+        store.derive(modifier_key(ability_name), [score_key(ability_name)], rules.modifier_str)
+    store.set("level", model.level)
+    store.derive(PROFICIENCY_BONUS_KEY, ["level"], rules.proficiency_bonus)
+    return store
+
+def load_model_into_store(store, model):
+    """Copies a (newly loaded) model into the store as one batch, so each subscriber is notified once."""
+    with store.batch():
+        for ability_name in model.abilities_list:
+            if ability_name in model.ability_scores:
+                store.set(score_key(ability_name), model.ability_scores[ability_name]["score"])
+        store.set("level", model.level)
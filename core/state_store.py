@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+
+class StateStore:
+    """
+    A UI-agnostic observable key/value store shared by the Flet views and the tkinter tools.
+
+    Derived values (e.g. an ability modifier) are computed by the store once per change, however many
+    widgets subscribe to them. Inside a batch() block notifications are held back until the block ends,
+    so each subscriber hears about a key at most once with its final value.
+    """
+    def __init__(self):
+        self._values = {}
+        self._subscribers = {}  # key -> [callback(value)]
+        self._computations = {} # derived key -> (dependency keys, compute function)
+        self._dependents = {}   # key -> [derived keys that read it]
+        self._batch_depth = 0
+        self._changed = {}      # keys to notify on the next flush (dict used as an ordered set)
+        self._dirty = {}        # derived keys to recompute on the next flush
+
+    def get(self, key, default=None):
+        """Returns the current value of key."""
+        return self._values.get(key, default)
+
+    def set(self, key, value):
+        """Stores value under key. Setting the value a key already has does nothing."""
+        if key in self._values and self._values[key] == value:
+            return
+        self._values[key] = value
+        self._changed[key] = None
+        for derived_key in self._dependents.get(key, ()):
+            self._dirty[derived_key] = None
+        if not self._batch_depth:
+            self._flush()
+
+    def derive(self, key, dependencies, compute):
+        """Declares key as compute(*dependency values), recomputed only when a dependency changes."""
+        dependencies = tuple(dependencies)
+        self._computations[key] = (dependencies, compute)
+        for dependency in dependencies:
+            self._dependents.setdefault(dependency, []).append(key)
+        self._values[key] = compute(*(self._values.get(dependency) for dependency in dependencies))
+
+    def subscribe(self, key, callback):
+        """Calls callback(new_value) whenever key changes. Returns a function that unsubscribes it."""
+        callbacks = self._subscribers.setdefault(key, [])
+        callbacks.append(callback)
+        return lambda: callbacks.remove(callback)
+
+    @contextmanager
+    def batch(self):
+        """Groups several set() calls so derived values are computed and subscribers notified once, at the end."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush()
+
+    def _flush(self):
+        """Recomputes dirty derived values, then notifies subscribers of every key that actually changed."""
+        while self._dirty:
+            key = next(iter(self._dirty))
+            del self._dirty[key]
+            dependencies, compute = self._computations[key]
+            value = compute(*(self._values.get(dependency) for dependency in dependencies))
+            if self._values.get(key) != value:
+                self._values[key] = value
+                self._changed[key] = None
+                # Derived-of-derived values settle in the same flush
+                for derived_key in self._dependents.get(key, ()):
+                    self._dirty[derived_key] = None
+
+        # Swap first, so a subscriber that calls set() starts a fresh round instead of re-notifying this one
+        changed, self._changed = self._changed, {}
+        for key in changed:
+            value = self._values[key]
+            for callback in list(self._subscribers.get(key, ())):
+                callback(value)
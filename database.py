@@ -1,12 +1,22 @@
 import sqlite3
 import json
+import uuid
 from contextlib import closing
 
 DATABASE_FILE = "dnd5e.db"
 
-def get_db_connection():
-    """Establishes and returns a connection to the SQLite database. i.e. Creates a database Connection object"""
-    connection = sqlite3.connect(DATABASE_FILE)
+# Tables whose rows are tracked in the change log: table -> (key column, JSON data column)
+SYNCED_TABLES = {
+    'characters': ('name', 'data'),
+    'users': ('username', 'preferences'),
+}
+
+def get_db_connection(database_file=None):
+    """
+    Establishes and returns a connection to the SQLite database. i.e. Creates a database Connection object
+    database_file defaults to DATABASE_FILE; passing another path lets sync tools open a second device's database.
+    """
+    connection = sqlite3.connect(database_file or DATABASE_FILE)
     
     # Allows access to columns by name
     connection.row_factory = sqlite3.Row
@@ -38,9 +48,135 @@ def init_db():
                 data TEXT NOT NULL
             )
         ''')
+
+        init_change_log(cursor)
         
         connection.commit()
 
+def init_change_log(cursor):
+    """
+    Creates the tables used for incremental sync between devices.
+    change_log keeps the latest change per (table, row, field) tagged with a Lamport clock
+    (a NULL value is a tombstone: the field was removed), sync_meta holds this device's id and clock, and sync_peers remembers the last sync point per peer.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS change_log (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            row_key TEXT NOT NULL,
+            field TEXT NOT NULL,
+            value TEXT,
+            clock INTEGER NOT NULL,
+            device_id TEXT NOT NULL,
+            UNIQUE (table_name, row_key, field)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS sync_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS sync_peers (
+            peer TEXT PRIMARY KEY,
+            last_sent_seq INTEGER NOT NULL DEFAULT 0,
+            last_received_seq INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    # OR IGNORE keeps the existing id/clock on every start after the first
+    cursor.execute("INSERT OR IGNORE INTO sync_meta (key, value) VALUES ('device_id', ?)", (uuid.uuid4().hex,))
+    cursor.execute("INSERT OR IGNORE INTO sync_meta (key, value) VALUES ('clock', '0')")
+
+    # Rows saved before the change log existed get logged once, in full, so they sync too.
+    # They are logged at clock 0 as a baseline, not an edit: two devices starting from copies
+    # of the same file must not see each other's baseline as a conflicting change.
+    for table_name, (key_column, data_column) in SYNCED_TABLES.items():
+        cursor.execute(f"SELECT {key_column} AS row_key, {data_column} AS data FROM {table_name} "
+                       f"WHERE {key_column} NOT IN (SELECT row_key FROM change_log WHERE table_name = ?)", (table_name,))
+        for row in cursor.fetchall():
+            record_changes(cursor, table_name, row['row_key'], None, json.loads(row['data']) if row['data'] else {}, baseline=True)
+
+def ensure_change_log(cursor):
+    """Creates the sync tables on first use, for databases (like a shipped dnd5e.db) that never ran init_db()."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sync_meta'")
+    if cursor.fetchone() is None:
+        init_change_log(cursor)
+
+def get_device_id(cursor):
+    """Returns this database's sync device id."""
+    cursor.execute("SELECT value FROM sync_meta WHERE key = 'device_id'")
+    return cursor.fetchone()['value']
+
+def advance_clock(cursor, seen_clock=0):
+    """
+    Lamport clock tick: moves the local clock past both itself and any clock seen from another device.
+    Returns the new clock value.
+    """
+    cursor.execute("SELECT value FROM sync_meta WHERE key = 'clock'")
+    clock = max(int(cursor.fetchone()['value']), seen_clock) + 1
+    cursor.execute("UPDATE sync_meta SET value = ? WHERE key = 'clock'", (str(clock),))
+    return clock
+
+def flatten_fields(data, path=()):
+    """
+    Flattens nested dictionaries into {field path tuple: leaf value}.
+    e.g. {'abilities': {'Strength': {'score': 12}}} -> {('abilities', 'Strength', 'score'): 12}
+    Empty dictionaries are kept as leaves so a blank row still produces a change.
+    """
+    if isinstance(data, dict) and data:
+        fields = {}
+        for key, value in data.items():
+            fields.update(flatten_fields(value, path + (key,)))
+        return fields
+    return {path: data}
+
+def child_field_prefix(path):
+    """
+    Returns the text every change_log field nested under path starts with, for prefix matching in SQL.
+    e.g. ('abilities', 'Strength') -> '["abilities", "Strength",'
+    """
+    return json.dumps(list(path))[:-1] + ","
+
+def record_changes(cursor, table_name, row_key, old_data, new_data, baseline=False):
+    """
+    Logs one change_log entry per field that differs between old_data and new_data.
+    Fields present in old_data but gone from new_data are logged as tombstones (NULL value),
+    so a removed key (e.g. a dropped skill) is removed on the other devices too.
+    Older entries for the same field are replaced, so the log never grows past one entry per field.
+    baseline=True logs at clock 0, which any real edit on any device outranks.
+    """
+    old_fields = flatten_fields(old_data)
+    new_fields = flatten_fields(new_data)
+    device_id = get_device_id(cursor)
+
+    def log(path, value_json):
+        clock = 0 if baseline else advance_clock(cursor)
+        cursor.execute("INSERT OR REPLACE INTO change_log (table_name, row_key, field, value, clock, device_id) VALUES (?, ?, ?, ?, ?, ?)",
+                       (table_name, row_key, json.dumps(list(path)), value_json, clock, device_id))
+
+    for path, value in new_fields.items():
+        if path in old_fields and old_fields[path] == value:
+            continue
+        log(path, json.dumps(value))
+
+    # Tombstone the highest key that is gone, e.g. a whole dropped skill rather than its 'proficient' leaf
+    new_prefixes = {new_path[:length] for new_path in new_fields for length in range(len(new_path) + 1)}
+    removed_paths = set()
+    for path in old_fields.keys() - new_fields.keys():
+        for length in range(1, len(path) + 1):
+            if path[:length] not in new_prefixes:
+                removed_paths.add(path[:length])
+                break
+        # No missing prefix: the path became the parent of new fields (e.g. {} -> {'x': 1}), not a removal
+
+    for path in removed_paths:
+        # Entries for keys inside the removed one are superseded by the tombstone
+        child_prefix = child_field_prefix(path)
+        cursor.execute("DELETE FROM change_log WHERE table_name = ? AND row_key = ? AND substr(field, 1, ?) = ?",
+                       (table_name, row_key, len(child_prefix), child_prefix))
+        log(path, None)
+
 def save_character(character_name, character_data):
     """
     Saves a character's data to the database.
@@ -50,6 +186,13 @@ def save_character(character_name, character_data):
         cursor = connection.cursor()
         # Convert the Python dictionary to a JSON string for storage
         data_json = json.dumps(character_data)
+
+        # Log only the fields that changed, for incremental sync
+        ensure_change_log(cursor)
+        cursor.execute("SELECT data FROM characters WHERE name = ?", (character_name,))
+        row = cursor.fetchone()
+        old_data = json.loads(row['data']) if row else {}
+        record_changes(cursor, 'characters', character_name, old_data, json.loads(data_json))
         
         # Use INSERT OR REPLACE to handle both new and existing characters
         cursor.execute("INSERT OR REPLACE INTO characters (name, data) VALUES (?, ?)",
@@ -80,6 +223,71 @@ def load_character(character_name):
         return json.loads(row['data'])
     return None # Return None if no character is found
 
+def iter_character_names():
+    """
+    Yields saved character names one at a time.
+    Unlike get_character_list(), rows are streamed from the cursor so a very large roster never sits in memory at once.
+    """
+    with closing(get_db_connection()) as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT name FROM characters ORDER BY name DESC")
+        for row in cursor:
+            yield row['name']
+
+def _fields_select(field_names):
+    """
+    Returns (SQL expression, parameters) that pull the given top-level fields out of a character's data.
+    Wrapping in json_array() always hands back a single JSON list, whatever the number of fields.
+    """
+    paths = [f"$.{field}" for field in field_names]
+    extracts = ", ".join("json_extract(data, ?)" for _ in paths)
+    return f"json_array({extracts})", paths
+
+def iter_character_fields(field_names):
+    """
+    Yields (name, {field name -> value}) for every saved character, in a single streamed query.
+    SQLite pulls the values out with json_extract(), so Python never parses the rest of each sheet.
+    """
+    fields_sql, params = _fields_select(field_names)
+    with closing(get_db_connection()) as connection:
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT name, {fields_sql} AS fields FROM characters ORDER BY name DESC", params)
+        for row in cursor:
+            yield row['name'], dict(zip(field_names, json.loads(row['fields'])))
+
+def iter_character_data(character_names=None):
+    """
+    Yields (name, data JSON string) for every saved character, or only those in character_names, in one streamed query.
+    The JSON is left unparsed so callers (e.g. export workers) can parse it wherever they like.
+    """
+    query = "SELECT name, data FROM characters"
+    params = ()
+    if character_names is not None:
+        params = tuple(character_names)
+        query += f" WHERE name IN ({', '.join('?' for _ in params)})"
+    with closing(get_db_connection()) as connection:
+        cursor = connection.cursor()
+        cursor.execute(query + " ORDER BY name DESC", params)
+        for row in cursor:
+            yield row['name'], row['data']
+
+def load_character_fields(character_name, field_names):
+    """
+    Fetches only the requested top-level fields of a character's saved data.
+    SQLite pulls the values out with json_extract(), so Python never parses the rest of the sheet.
+    Returns a dictionary of field name -> value (None for missing fields), or None if no character is found.
+    """
+    fields_sql, params = _fields_select(field_names)
+    with closing(get_db_connection()) as connection:
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT {fields_sql} AS fields FROM characters WHERE name = ?",
+                       (*params, character_name))
+        row = cursor.fetchone()
+
+    if row:
+        return dict(zip(field_names, json.loads(row['fields'])))
+    return None # Return None if no character is found
+
 def get_races():
     """Fetches and returns a list of all race names from the database."""
     with closing(get_db_connection()) as connection:
@@ -122,5 +330,7 @@ class UserPreferences:
                 else: # User does not exist
                      cursor.execute("INSERT INTO users (username, preferences) VALUES (?, ?)",
                                    (self.username, prefs_json))
+                ensure_change_log(cursor)
+                record_changes(cursor, 'users', self.username, None, default_prefs)
                 connection.commit()
                 return default_prefs
\ No newline at end of file
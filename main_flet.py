@@ -1,9 +1,28 @@
+import os
 import flet as ft
+from core.character_state import load_model_into_store
 from models.character_model import CharacterModel
 from views.character_sheet_view import CharacterSheetView
 from views.load_character_dialog import LoadCharacterDialog
+from views.payload_monitor import PayloadMonitor
 import database
 
+# Max patches/bytes shipped to the client per update() (control class names) or per interaction (handler labels).
+# Opt in with CHARSHEET_PAYLOAD_MONITOR=1 to print warnings, or =strict to fail on the first overrun (test mode).
+# Sections with pooled, variable-length lists (skill rows...) get a per-control allowance on top of a fixed base,
+# sized for the worst case: a hidden 4-control skill row re-bound with new content ships 3 patches
+# (visible, checkbox, name), i.e. 0.75 per control, and a newly added row ~70 bytes per control.
+# testpages/TEST_PayloadBudgets.py runs these in strict mode.
+PAYLOAD_BUDGETS = {
+    "AbilityScoreContainer": {"max_patches": 8, "max_patches_per_control": 0.75, "max_bytes": 1024, "max_bytes_per_control": 96},
+    "CharacterHeaderContainer": {"max_patches": 16, "max_bytes": 2048},
+    # The components redraw themselves, so these controller handlers should ship (almost) nothing
+    "score_change": {"max_patches": 0},
+    # (level edits also redraw the proficiency bonus text; an XP level-up redraws the level field too)
+    "header_change": {"max_patches": 2, "max_bytes": 512},
+    "load_character": {"max_patches": 16, "max_patches_per_control": 0.75, "max_bytes": 2048, "max_bytes_per_control": 96},
+}
+
 def main(page: ft.Page):
     # --- Page and Model Setup ---
     page.title = "Flet Character Sheet"
@@ -12,6 +31,17 @@ def main(page: ft.Page):
 
     model = CharacterModel()
 
+    # --- Optional update() payload instrumentation ---
+    monitor_mode = os.environ.get("CHARSHEET_PAYLOAD_MONITOR")
+    monitor = None
+    if monitor_mode:
+        monitor = PayloadMonitor(PAYLOAD_BUDGETS, strict=(monitor_mode == "strict"))
+        monitor.attach(page)
+
+    def track(label, handler):
+        """Measures a handler as one interaction when the monitor is on; otherwise returns it untouched."""
+        return monitor.track(label, handler) if monitor else handler
+
     # --- 1. Define Controller Logic / Event Handlers FIRST ---
     def on_header_change(e: ft.ControlEvent):
         """
@@ -34,8 +64,17 @@ def main(page: ft.Page):
                 e.control.value = str(old_value) # Fix the UI
         
         # Update the model attribute
-        setattr(model, attr_name, new_value)
-        # No page.update() needed, as the TextField already shows the new value.
+        if attr_name == 'experience_points':
+            if model.set_experience_points(new_value):
+                # Crossed an XP threshold: show the new level (the only time this handler redraws)
+                view.header.level_field.value = str(model.level)
+                view.header.update()
+                view.store.set("level", model.level)
+        else:
+            setattr(model, attr_name, new_value)
+            if attr_name == 'level':
+                view.store.set("level", new_value)
+        # Otherwise no page.update() needed, as the TextField already shows the new value.
 
     def on_score_change(ability_name: str, new_score: int):
         """Handles updates coming from AbilityScoreContainer components."""
@@ -47,7 +86,7 @@ def main(page: ft.Page):
         # The component already updated its own visual state.
 
     # --- 2. Build UI View SECOND (pass handlers as arguments) ---
-    view = CharacterSheetView(model, on_score_change, on_header_change)
+    view = CharacterSheetView(model, track("score_change", on_score_change), track("header_change", on_header_change))
 
     # --- 3. Other Application Logic ---
     def save_character(e):
@@ -72,6 +111,9 @@ def main(page: ft.Page):
         Updates all controls in the view to match the model's data.
         This is the core of the state management for loading.
         """
+        # 0. Push the new values through the shared store in one batch, so derived values compute once
+        load_model_into_store(view_controls.store, model_data)
+
         # 1. Update Header Fields
         view_controls.header.update_header_data(model_data)
 
@@ -115,7 +157,7 @@ def main(page: ft.Page):
         # 4. Instantiate and open our custom dialog component
         dialog = LoadCharacterDialog(
             character_list=character_list,
-            on_load_confirm=handle_load,
+            on_load_confirm=track("load_character", handle_load),
             on_cancel=handle_cancel
         )
         page.open(dialog)
@@ -124,8 +166,8 @@ def main(page: ft.Page):
     page.appbar = ft.AppBar(
         title=ft.Text("Flet Character Sheet"),
         actions=[
-            ft.IconButton(ft.Icons.SAVE, on_click=save_character, tooltip="Save Character"),
-            ft.IconButton(ft.Icons.FOLDER_OPEN, on_click=open_load_dialog, tooltip="Load Character"),
+            ft.IconButton(ft.Icons.SAVE, on_click=track("save_character", save_character), tooltip="Save Character"),
+            ft.IconButton(ft.Icons.FOLDER_OPEN, on_click=track("open_load_dialog", open_load_dialog), tooltip="Load Character"),
         ]
     )
 
@@ -1,6 +1,25 @@
 import database
+from models import rules
 
 class CharacterModel():
+    # Top-level (non-ability) fields of a saved sheet and the value used when one is missing
+    HEADER_LOAD_DEFAULTS = {
+        'charactername': "Unknown",
+        'characterclass': "Class",
+        'level': 1,
+        'background': "Background",
+        'player_name': "Player Name",
+        'race': "Race",
+        'alignment': "Alignment",
+        'experience_points': 0,
+        'armor_class': 10,
+        'initiative': 0,
+        'speed': 30,
+        'max_hp': 10,
+        'current_hp': 10,
+        'temp_hp': 0,
+    }
+
     def __init__(self, character_to_load=None):
         """Initializes data model with standard Python types."""
         # --- Character Attributes ---
@@ -52,23 +71,23 @@ class CharacterModel():
         # Ensure ability_name is capitalized correctly
         ability_name = ability_name.capitalize()
         score = self.ability_scores.get(ability_name, {}).get("score", 10)
-        modifier = (score - 10) // 2
-        return f"+{modifier}" if modifier >= 0 else str(modifier)
+        return rules.modifier_str(score)
 
     def calc_proficiency_bonus(self):
         """Calculates and returns Proficiency Bonus based on character level."""
-        level = self.level
-        if (1 <= level) and (level <= 4): # "Long form" syntax
-            return 2
-        elif 5 <= level <= 8: # Syntactic sugar
-            return 3
-        elif 9 <= level <= 12:
-            return 4
-        elif 13 <= level <= 16:
-            return 5
-        elif 17 <= level <= 20:
-            return 6
-        return 0
+        return rules.proficiency_bonus(self.level)
+
+    def set_experience_points(self, experience_points):
+        """
+        Sets XP and levels the character up if it crossed an XP threshold.
+        Never levels down, so milestone levels set by hand are kept. Returns True if the level changed.
+        """
+        self.experience_points = experience_points
+        new_level = rules.level_for_xp(experience_points)
+        if new_level > self.level:
+            self.level = new_level
+            return True
+        return False
     
     def load_character(self, character_name):
         """Fetches data from DB and populates the model's attributes."""
@@ -77,27 +96,18 @@ class CharacterModel():
             print(f"Load Error: Could not find data for {character_name}.")
             return False # Return a status
 
+        self.populate_from_dictionary(data)
+        return True
+
+    def populate_from_dictionary(self, data):
+        """Populates the model's attributes from a saved-sheet dictionary (the inverse of convert_to_dictionary)."""
         # Directly assign attributes
-        self.charactername = data.get('charactername', "Unknown")
-        self.characterclass = data.get('characterclass', "Class")
-        self.level = data.get('level', 1)
-        self.background = data.get('background', "Background")
-        self.player_name = data.get('player_name', "Player Name")
-        self.race = data.get('race', "Race")
-        self.alignment = data.get('alignment', "Alignment")
-        self.experience_points = data.get('experience_points', 0)
-        self.armor_class = data.get('armor_class', 10)
-        self.initiative = data.get('initiative', 0)
-        self.speed = data.get('speed', 30)
-        self.max_hp = data.get('max_hp', 10)
-        self.current_hp = data.get('current_hp', 10)
-        self.temp_hp = data.get('temp_hp', 0)
+        for field, default in self.HEADER_LOAD_DEFAULTS.items():
+            setattr(self, field, data.get(field, default))
         
         # Load nested ability data
         if 'abilities' in data:
             self.ability_scores = data['abilities']
-        
-        return True
     
     def convert_to_dictionary(self):
         """Gathers all model data into a Python dictionary for saving."""
@@ -128,4 +138,61 @@ class CharacterModel():
         character_data = self.convert_to_dictionary()
         database.save_character(self.charactername, character_data)
         print(f"Success: Character '{self.charactername}' was saved.")
-        return True
\ No newline at end of file
+        return True
+
+
+class LazyCharacterModel(CharacterModel):
+    """
+    A CharacterModel proxy for a saved character that reads nothing up front.
+    Header fields are fetched together on first access (or handed in already fetched by iter_lazy_characters),
+    and ability/skill data only when ability_scores is touched, so a roster only pays for the fields it reads.
+    """
+    def __init__(self, character_name, header_fields=None):
+        # Deliberately skip CharacterModel.__init__: every attribute is filled in on demand by __getattr__
+        self._character_name = character_name
+        if header_fields is not None:
+            self._set_header(header_fields)
+
+    def __getattr__(self, name):
+        """Only called when normal lookup fails, i.e. for fields that have not been loaded yet."""
+        if name in self.HEADER_LOAD_DEFAULTS:
+            self._load_header()
+        elif name == 'ability_scores':
+            self._load_abilities()
+        elif name in ('abilities_list', 'skills_map'):
+            defaults = CharacterModel()
+            self.abilities_list = defaults.abilities_list
+            self.skills_map = defaults.skills_map
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self.__dict__[name]
+
+    def _load_header(self):
+        """Fetches every header field in a single query, leaving the ability data untouched."""
+        fields = database.load_character_fields(self._character_name, list(self.HEADER_LOAD_DEFAULTS))
+        self._set_header(fields or {})
+
+    def _set_header(self, fields):
+        """Fills in the header attributes from fetched values, using the load defaults for missing ones."""
+        for field, default in self.HEADER_LOAD_DEFAULTS.items():
+            value = fields.get(field)
+            # Don't clobber a field the caller has already set on the proxy
+            self.__dict__.setdefault(field, default if value is None else value)
+
+    def _load_abilities(self):
+        """Fetches only the nested ability/skill data, falling back to a blank sheet's scores."""
+        fields = database.load_character_fields(self._character_name, ['abilities'])
+        if fields and fields['abilities'] is not None:
+            self.ability_scores = fields['abilities']
+        else:
+            self.ability_scores = CharacterModel().ability_scores
+
+
+def iter_lazy_characters():
+    """
+    Yields a LazyCharacterModel for every saved character.
+    Header fields come from one streamed query over the whole roster (memory stays bounded);
+    only ability/skill data is still fetched per character, and only when touched.
+    """
+    for character_name, header_fields in database.iter_character_fields(list(CharacterModel.HEADER_LOAD_DEFAULTS)):
+        yield LazyCharacterModel(character_name, header_fields)
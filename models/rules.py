@@ -0,0 +1,57 @@
+# D&D 5e level and ability rules as precomputed lookup tables.
+# Built once at import time from the source data below and shared by the model, the views
+# and any batch tools, so a level-up, XP change or score edit is a single lookup.
+from bisect import bisect_right
+
+MAX_LEVEL = 20
+MIN_SCORE = 1
+MAX_SCORE = 30
+
+# --- Source Data (Player's Handbook, Character Advancement table) ---
+# Minimum XP needed to reach each level, starting at level 1
+XP_THRESHOLDS = (
+    0, 300, 900, 2700, 6500, 14000, 23000, 34000, 48000, 64000,
+    85000, 100000, 120000, 140000, 165000, 195000, 225000, 265000, 305000, 355000,
+)
+# (first level, last level, proficiency bonus)
+PROFICIENCY_RANGES = (
+    (1, 4, 2),
+    (5, 8, 3),
+    (9, 12, 4),
+    (13, 16, 5),
+    (17, 20, 6),
+)
+
+# --- Precomputed Tables ---
+# Indexed directly by level; index 0 (and anything past MAX_LEVEL) has no bonus
+PROFICIENCY_BY_LEVEL = tuple(
+    next((bonus for first, last, bonus in PROFICIENCY_RANGES if first <= level <= last), 0)
+    for level in range(MAX_LEVEL + 1)
+)
+# Indexed by score - MIN_SCORE, covering MIN_SCORE through MAX_SCORE
+MODIFIER_BY_SCORE = tuple((score - 10) // 2 for score in range(MIN_SCORE, MAX_SCORE + 1))
+MODIFIER_STR_BY_SCORE = tuple(f"+{modifier}" if modifier >= 0 else str(modifier) for modifier in MODIFIER_BY_SCORE)
+
+
+def proficiency_bonus(level: int) -> int:
+    """Returns the proficiency bonus for a level, or 0 for levels outside 1-20."""
+    if 1 <= level <= MAX_LEVEL:
+        return PROFICIENCY_BY_LEVEL[level]
+    return 0
+
+def level_for_xp(experience_points: int) -> int:
+    """Returns the character level reached with the given experience points (1-20)."""
+    return max(1, bisect_right(XP_THRESHOLDS, experience_points))
+
+def ability_modifier(score: int) -> int:
+    """Returns the ability modifier for a score."""
+    if MIN_SCORE <= score <= MAX_SCORE:
+        return MODIFIER_BY_SCORE[score - MIN_SCORE]
+    return (score - 10) // 2 # Out-of-range input (e.g. mid-edit in a text field) still gets an answer
+
+def modifier_str(score: int) -> str:
+    """Returns the ability modifier for a score as a signed string, e.g. "+2" or "-1"."""
+    if MIN_SCORE <= score <= MAX_SCORE:
+        return MODIFIER_STR_BY_SCORE[score - MIN_SCORE]
+    modifier = ability_modifier(score)
+    return f"+{modifier}" if modifier >= 0 else str(modifier)
@@ -0,0 +1,182 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from multiprocessing import Pool
+
+import database
+from models.character_model import CharacterModel
+
+# --- Page Layout (PDF points; PNG uses the same grid at 100 dpi) ---
+PAGE_WIDTH = 612   # US Letter, 8.5in
+PAGE_HEIGHT = 792  # 11in
+MARGIN = 54
+FONT_SIZE = 11
+LINE_HEIGHT = 14
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+
+def sheet_lines(model: CharacterModel):
+    """Lays out a character sheet as plain text lines, shared by every output format."""
+    lines = [
+        model.charactername,
+        f"{model.characterclass} {model.level} | {model.race} | {model.background} | {model.alignment}",
+        f"Player: {model.player_name}    XP: {model.experience_points}",
+        "",
+        f"AC {model.armor_class}    Initiative {model.initiative}    Speed {model.speed}",
+        f"HP {model.current_hp}/{model.max_hp}    Temp HP {model.temp_hp}    Proficiency Bonus +{model.calc_proficiency_bonus()}",
+        "",
+    ]
+    for ability_name, ability_data in model.ability_scores.items():
+        lines.append(f"{ability_name.upper()}  {ability_data['score']} ({model.calc_ability_modifier(ability_name)})")
+        for skill_name, skill_info in ability_data["skills"].items():
+            marker = "[x]" if skill_info["proficient"] else "[ ]"
+            lines.append(f"    {marker} {skill_name}")
+    return lines
+
+def _pdf_escape(text: str) -> str:
+    """Escapes the characters that are special inside a PDF string literal."""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def paginate(lines):
+    """Splits sheet lines into pages of at most LINES_PER_PAGE, so long sheets are never drawn off the page."""
+    return [lines[start:start + LINES_PER_PAGE] for start in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+def render_pdf(lines):
+    """
+    Renders text lines to a PDF (one page per LINES_PER_PAGE lines) using the built-in Helvetica font.
+    Written by hand so PDF export needs no third-party library. Returns a list holding the one PDF file's bytes.
+    """
+    pages = paginate(lines)
+    # Objects 1 and 2 are the catalog and page tree, 3 the font, then a (page, contents) pair per page
+    page_numbers = [4 + 2 * index for index in range(len(pages))]
+    kids = " ".join(f"{number} 0 R" for number in page_numbers)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode("latin-1"),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for page_number, page_lines in zip(page_numbers, pages):
+        text_ops = [f"BT /F1 {FONT_SIZE} Tf {LINE_HEIGHT} TL {MARGIN} {PAGE_HEIGHT - MARGIN} Td"]
+        for line in page_lines:
+            text_ops.append(f"({_pdf_escape(line)}) Tj T*")
+        text_ops.append("ET")
+        stream = "\n".join(text_ops).encode("latin-1", errors="replace")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_number + 1} 0 R >>".encode("latin-1"))
+        objects.append(b"<< /Length " + str(len(stream)).encode("latin-1") + b" >>\nstream\n" + stream + b"\nendstream")
+
+    # The cross-reference table needs the byte offset of every object
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n".encode("latin-1") + body + b"\nendobj\n"
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        pdf += f"{offset:010d} 00000 n \n".encode("latin-1")
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode("latin-1")
+    return [bytes(pdf)]
+
+def render_png(lines):
+    """
+    Renders text lines to PNG images, one per page. Requires Pillow (pip install pillow).
+    Returns a list of each page's PNG bytes.
+    """
+    # Imported here so PDF-only exports still work on machines without Pillow
+    from io import BytesIO
+    from PIL import Image, ImageDraw, ImageFont
+
+    scale = 100 / 72 # Points -> pixels at 100 dpi
+    font = ImageFont.load_default(size=round(FONT_SIZE * scale))
+    images = []
+    for page_lines in paginate(lines):
+        image = Image.new("RGB", (round(PAGE_WIDTH * scale), round(PAGE_HEIGHT * scale)), "white")
+        draw = ImageDraw.Draw(image)
+        y = MARGIN * scale
+        for line in page_lines:
+            draw.text((MARGIN * scale, y), line, fill="black", font=font)
+            y += LINE_HEIGHT * scale
+
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+        images.append(buffer.getvalue())
+    return images
+
+RENDERERS = {
+    "pdf": render_pdf,
+    "png": render_png,
+}
+
+def _safe_filename(character_name: str) -> str:
+    """
+    Turns a character name into something every OS accepts as a file name.
+    A short hash of the exact name is appended, so names that clean up to the same text
+    ("Bob?" / "Bob*") or differ only by case ("bob" / "Bob" on Windows/macOS) never overwrite each other.
+    """
+    readable = re.sub(r"[^\w\- ]", "_", character_name).strip() or "character"
+    name_hash = hashlib.sha1(character_name.encode("utf-8")).hexdigest()[:8]
+    return f"{readable}-{name_hash}"
+
+def export_character(job):
+    """
+    Worker task: builds one character from its saved data, renders every requested format and writes the files straight to disk.
+    Returns (character name, number of files written) so the parent never holds rendered output.
+    """
+    character_name, data_json, output_dir, formats = job
+    model = CharacterModel()
+    model.populate_from_dictionary(json.loads(data_json))
+
+    lines = sheet_lines(model)
+    files_written = 0
+    for file_format in formats:
+        for page_index, page_bytes in enumerate(RENDERERS[file_format](lines)):
+            # Extra PNG pages get their own numbered files
+            page_suffix = f"-p{page_index + 1}" if page_index else ""
+            path = os.path.join(output_dir, f"{_safe_filename(character_name)}{page_suffix}.{file_format}")
+            with open(path, "wb") as output_file:
+                output_file.write(page_bytes)
+            files_written += 1
+    return character_name, files_written
+
+def export_roster(output_dir, formats=("pdf", "png"), processes=None, character_names=None):
+    """
+    Exports every saved character (or just character_names) using a process pool across all cores.
+    Sheets are read by one streamed query in the parent and handed to the workers, so workers never
+    open the database, and results are streamed back, so memory stays flat for any roster size.
+    Returns a summary dictionary including sheets per second.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = ((name, data_json, output_dir, tuple(formats))
+            for name, data_json in database.iter_character_data(character_names))
+
+    sheets = 0
+    files = 0
+    start = time.perf_counter()
+    with Pool(processes=processes) as pool:
+        for _, written in pool.imap_unordered(export_character, jobs, chunksize=16):
+            if written:
+                sheets += 1
+                files += written
+    elapsed = time.perf_counter() - start
+
+    return {
+        'sheets': sheets,
+        'files': files,
+        'seconds': elapsed,
+        'sheets_per_second': sheets / elapsed if elapsed else 0.0,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export character sheets to PDF/PNG without launching the UI.")
+    parser.add_argument("output_dir", help="Folder the exported sheets are written to")
+    parser.add_argument("--formats", nargs="+", choices=sorted(RENDERERS), default=["pdf", "png"])
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--characters", nargs="+", default=None, help="Only export these characters")
+    args = parser.parse_args()
+
+    summary = export_roster(args.output_dir, args.formats, args.processes, args.characters)
+    print(f"Exported {summary['sheets']} sheets ({summary['files']} files) in {summary['seconds']:.2f}s "
+          f"- {summary['sheets_per_second']:.1f} sheets/sec")
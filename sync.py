@@ -0,0 +1,257 @@
+import json
+import zlib
+from contextlib import closing
+
+import database
+
+SERVER_PEER = "server"
+
+def encode_payload(payload):
+    """Serializes a sync payload to compact, compressed bytes for the wire."""
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+def decode_payload(payload_bytes):
+    """Reverses encode_payload()."""
+    return json.loads(zlib.decompress(payload_bytes).decode("utf-8"))
+
+def _change_key(change):
+    """Total order used for last-writer-wins: Lamport clock first, device id breaks ties."""
+    return (change['clock'], change['device_id'])
+
+def _set_field(data, path, value):
+    """Writes value into nested dictionaries at path, creating levels as needed. Returns the new data."""
+    if not path:
+        return value
+    if not isinstance(data, dict):
+        data = {}
+    level = data
+    for key in path[:-1]:
+        if not isinstance(level.get(key), dict):
+            level[key] = {}
+        level = level[key]
+    level[path[-1]] = value
+    return data
+
+def _remove_field(data, path):
+    """Deletes the key at path from nested dictionaries, if it is there. Returns the new data."""
+    if not path:
+        return {}
+    level = data if isinstance(data, dict) else {}
+    for key in path[:-1]:
+        level = level.get(key)
+        if not isinstance(level, dict):
+            return data
+    level.pop(path[-1], None)
+    return data
+
+def _change_value(change):
+    """What a change leaves behind, for comparing two changes: a removed field compares unlike any value."""
+    return ('deleted',) if change.get('deleted') else ('value', change['value'])
+
+def _apply_change(cursor, change):
+    """Writes (or, for a tombstone, removes) a single remote field in its table row, without logging it as a local change."""
+    key_column, data_column = database.SYNCED_TABLES[change['table']]
+    cursor.execute(f"SELECT {data_column} AS data FROM {change['table']} WHERE {key_column} = ?", (change['row'],))
+    row = cursor.fetchone()
+    data = json.loads(row['data']) if row and row['data'] else {}
+    if change.get('deleted'):
+        data = _remove_field(data, change['field'])
+    else:
+        data = _set_field(data, change['field'], change['value'])
+    cursor.execute(f"INSERT INTO {change['table']} ({key_column}, {data_column}) VALUES (?, ?) "
+                   f"ON CONFLICT({key_column}) DO UPDATE SET {data_column} = excluded.{data_column}",
+                   (change['row'], json.dumps(data)))
+
+def _log_entry(row):
+    """Turns a change_log row into a change dictionary (the same shape export_changes() sends)."""
+    return {
+        'seq': row['seq'],
+        'field': json.loads(row['field']),
+        # A NULL value is a tombstone for a removed field
+        'value': json.loads(row['value']) if row['value'] is not None else None,
+        'deleted': row['value'] is None,
+        'clock': row['clock'],
+        'device_id': row['device_id'],
+    }
+
+def _is_unsent_local_edit(entry, device_id, last_sent_seq):
+    """True for a change made on this device since the last push. Clock 0 entries are the pre-sync baseline, not edits."""
+    return entry['device_id'] == device_id and entry['seq'] > last_sent_seq and entry['clock'] > 0
+
+def _conflict(change, local_change, field):
+    """Describes a conflict between a remote change and a local one at field, noting which side won."""
+    return {
+        'table': change['table'],
+        'row': change['row'],
+        'field': field,
+        'local_value': local_change['value'],
+        'local_deleted': local_change['deleted'],
+        'remote_value': change['value'],
+        'remote_deleted': bool(change.get('deleted')),
+        'winner': "remote" if _change_key(change) > _change_key(local_change) else "local",
+    }
+
+def _ancestor_tombstone(cursor, change):
+    """Returns the newest logged removal of a key that contains change's field (e.g. the skill holding a 'proficient' flag), or None."""
+    ancestors = [json.dumps(change['field'][:length]) for length in range(1, len(change['field']))]
+    if not ancestors:
+        return None
+    cursor.execute(f"SELECT seq, field, value, clock, device_id FROM change_log WHERE table_name = ? AND row_key = ? "
+                   f"AND value IS NULL AND field IN ({', '.join('?' for _ in ancestors)})",
+                   (change['table'], change['row'], *ancestors))
+    return max((_log_entry(row) for row in cursor.fetchall()), key=_change_key, default=None)
+
+def _descendant_entries(cursor, change):
+    """Returns the logged changes to keys nested inside change's field."""
+    child_prefix = database.child_field_prefix(change['field'])
+    cursor.execute("SELECT seq, field, value, clock, device_id FROM change_log WHERE table_name = ? AND row_key = ? AND substr(field, 1, ?) = ?",
+                   (change['table'], change['row'], len(child_prefix), child_prefix))
+    return [_log_entry(row) for row in cursor.fetchall()]
+
+def _get_peer_state(cursor, peer):
+    """Returns (last_sent_seq, last_received_seq) for a peer, registering it on first use."""
+    cursor.execute("INSERT OR IGNORE INTO sync_peers (peer) VALUES (?)", (peer,))
+    cursor.execute("SELECT last_sent_seq, last_received_seq FROM sync_peers WHERE peer = ?", (peer,))
+    row = cursor.fetchone()
+    return row['last_sent_seq'], row['last_received_seq']
+
+def export_changes(cursor, since_seq):
+    """
+    Returns (changes, last_seq): every change made on THIS device after since_seq.
+    Changes received from other devices are not re-exported; the server already has them.
+    """
+    device_id = database.get_device_id(cursor)
+    cursor.execute("SELECT seq, table_name, row_key, field, value, clock, device_id FROM change_log "
+                   "WHERE seq > ? AND device_id = ? ORDER BY seq", (since_seq, device_id))
+    changes = []
+    last_seq = since_seq
+    for row in cursor.fetchall():
+        changes.append({
+            'table': row['table_name'],
+            'row': row['row_key'],
+            'field': json.loads(row['field']),
+            # A NULL value is a tombstone for a removed field
+            'value': json.loads(row['value']) if row['value'] is not None else None,
+            'deleted': row['value'] is None,
+            'clock': row['clock'],
+            'device_id': row['device_id'],
+        })
+        last_seq = row['seq']
+    # Nothing new from this device: still move the sync point past any received entries
+    cursor.execute("SELECT COALESCE(MAX(seq), 0) AS max_seq FROM change_log")
+    return changes, max(last_seq, cursor.fetchone()['max_seq'])
+
+def import_changes(cursor, changes, last_sent_seq):
+    """
+    Applies remote changes field by field using last-writer-wins on (clock, device_id).
+    A removed key also outranks older changes inside it, and a newer change inside a removed key brings that field back.
+    A conflict is a field this device changed since last_sent_seq that the remote also changed to a different value,
+    or removed along with a key containing it (and the same the other way round).
+    Returns the list of conflicts, each noting both values and which side won.
+    """
+    device_id = database.get_device_id(cursor)
+    conflicts = []
+    for change in changes:
+        database.advance_clock(cursor, change['clock'])
+        field_json = json.dumps(change['field'])
+        cursor.execute("SELECT seq, field, value, clock, device_id FROM change_log WHERE table_name = ? AND row_key = ? AND field = ?",
+                       (change['table'], change['row'], field_json))
+        local = cursor.fetchone()
+
+        if local:
+            local_change = _log_entry(local)
+            if _change_key(change) == _change_key(local_change):
+                continue # Our own change coming back, or one we already have
+            if _is_unsent_local_edit(local_change, device_id, last_sent_seq) and _change_value(local_change) != _change_value(change):
+                conflicts.append(_conflict(change, local_change, change['field']))
+            if _change_key(change) < _change_key(local_change):
+                continue # The local value is newer; keep it
+
+        # A key containing this field was removed here (e.g. a dropped skill vs. an edit to its 'proficient' flag)
+        tombstone = _ancestor_tombstone(cursor, change)
+        if tombstone:
+            if not change.get('deleted') and _is_unsent_local_edit(tombstone, device_id, last_sent_seq):
+                conflicts.append(_conflict(change, tombstone, change['field']))
+            if _change_key(change) < _change_key(tombstone):
+                continue # The removal is newer; the field stays gone
+
+        # A remote removal supersedes older changes inside the removed key, but not newer ones
+        newer_descendants = []
+        if change.get('deleted'):
+            for descendant in _descendant_entries(cursor, change):
+                if not descendant['deleted'] and _is_unsent_local_edit(descendant, device_id, last_sent_seq):
+                    conflicts.append(_conflict(change, descendant, descendant['field']))
+                if _change_key(descendant) > _change_key(change):
+                    newer_descendants.append(descendant)
+                else:
+                    cursor.execute("DELETE FROM change_log WHERE seq = ?", (descendant['seq'],))
+
+        _apply_change(cursor, change)
+        for descendant in newer_descendants:
+            _apply_change(cursor, {**descendant, 'table': change['table'], 'row': change['row']})
+        value_json = None if change.get('deleted') else json.dumps(change['value'])
+        cursor.execute("INSERT OR REPLACE INTO change_log (table_name, row_key, field, value, clock, device_id) VALUES (?, ?, ?, ?, ?, ?)",
+                       (change['table'], change['row'], field_json, value_json, change['clock'], change['device_id']))
+    return conflicts
+
+def sync_with_server(server, database_file=None):
+    """
+    Runs one incremental sync round against a server: pull and merge remote changes, then push local ones.
+    Only changes since the last sync point travel in either direction.
+    Returns a report dictionary with change counts, payload sizes and any field conflicts.
+    """
+    with closing(database.get_db_connection(database_file)) as connection:
+        cursor = connection.cursor()
+        database.init_change_log(cursor)
+        last_sent_seq, last_received_seq = _get_peer_state(cursor, SERVER_PEER)
+
+        # 1. Pull first, so conflicts are detected against local edits the server hasn't seen yet
+        pulled_bytes = server.pull(last_received_seq, database.get_device_id(cursor))
+        pulled = decode_payload(pulled_bytes)
+        conflicts = import_changes(cursor, pulled['changes'], last_sent_seq)
+
+        # 2. Push whatever this device changed since the last sync point
+        changes, last_seq = export_changes(cursor, last_sent_seq)
+        pushed_bytes = encode_payload({'changes': changes})
+        if changes:
+            server.push(pushed_bytes)
+
+        cursor.execute("UPDATE sync_peers SET last_sent_seq = ?, last_received_seq = ? WHERE peer = ?",
+                       (last_seq, pulled['cursor'], SERVER_PEER))
+        connection.commit()
+
+    return {
+        'received': len(pulled['changes']),
+        'sent': len(changes),
+        'bytes_received': len(pulled_bytes),
+        'bytes_sent': len(pushed_bytes) if changes else 0,
+        'conflicts': conflicts,
+    }
+
+class LocalSyncServer:
+    """
+    An in-process stand-in for a sync server, for tests and local experiments.
+    Keeps only the winning change per field, numbered by a server-side sequence that clients use as their cursor.
+    """
+    def __init__(self):
+        self.seq = 0
+        self.latest = {} # (table, row, field) -> (server seq, change)
+
+    def push(self, payload_bytes):
+        """Accepts an encoded batch of changes, keeping the last writer per field."""
+        for change in decode_payload(payload_bytes)['changes']:
+            key = (change['table'], change['row'], json.dumps(change['field']))
+            stored = self.latest.get(key)
+            if stored and _change_key(stored[1]) >= _change_key(change):
+                continue
+            self.seq += 1
+            self.latest[key] = (self.seq, change)
+
+    def pull(self, since_seq, device_id=None):
+        """
+        Returns the encoded changes newer than since_seq, plus the cursor to send next time.
+        Changes made by device_id itself are left out; it already has them.
+        """
+        changes = [change for seq, change in sorted(self.latest.values(), key=lambda entry: entry[0])
+                   if seq > since_seq and change['device_id'] != device_id]
+        return encode_payload({'changes': changes, 'cursor': self.seq})
@@ -0,0 +1,89 @@
+# Runnable check that the app stays inside PAYLOAD_BUDGETS (main_flet.py) in strict mode.
+# Run from the project root: python -m testpages.TEST_PayloadBudgets
+# Drives the real handlers on an offline page, loading characters whose skill lists grow, shrink to nothing
+# and grow back, which is the worst case for the pooled rows. Works on a temporary copy of dnd5e.db.
+import os
+import shutil
+import tempfile
+
+import database
+import main_flet
+from models.character_model import CharacterModel
+from testpages.offline_page import make_offline_page
+
+SOURCE_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dnd5e.db")
+
+# (character name, skill rows per ability, whether even-numbered skills are proficient) in load order.
+# The flags flip each time a row is re-bound, so every re-bound checkbox changes too.
+CHARACTERS = [
+    ("Budget Huge", 500, True),
+    ("Budget Empty", 0, False),
+    ("Budget Huge Again", 500, False), # Every pooled row re-bound from hidden, with new names and flags
+    ("Budget Small", 5, True),
+    ("Budget Mid", 120, True),
+]
+
+class FakeEvent:
+    """Just enough of a ControlEvent for the handlers under test."""
+    def __init__(self, control):
+        self.control = control
+
+def save_character(character_name, skill_count, even_proficient):
+    model = CharacterModel()
+    model.charactername = character_name
+    for ability_name, ability_data in model.ability_scores.items():
+        ability_data["skills"] = {f"{character_name} {ability_name} skill {i}": {"proficient": (i % 2 == 0) == even_proficient}
+                                  for i in range(skill_count)}
+    assert model.save_character(), character_name
+
+def load_through_dialog(page, character_name):
+    """Opens the load dialog and confirms character_name, like clicking Load."""
+    open_button = page.appbar.actions[1]
+    open_button.on_click(None)
+    dialog = page.overlay[-1]
+    dialog.on_load_confirm(character_name)
+
+def type_into(field, value):
+    """Sets a field's value and fires its on_change, like typing into it."""
+    # Typed values arrive from the client, so Flet stores them without marking the field for re-sending
+    field._set_attr("value", value, dirty=False)
+    field.on_change(FakeEvent(field))
+
+def run_checks():
+    for character_name, skill_count, even_proficient in CHARACTERS:
+        save_character(character_name, skill_count, even_proficient)
+
+    os.environ["CHARSHEET_PAYLOAD_MONITOR"] = "strict"
+    page = make_offline_page()
+    main_flet.main(page)
+    view = page.controls[0]
+
+    # Any overrun raises PayloadBudgetExceeded straight out of the handler
+    for character_name, skill_count, _ in CHARACTERS:
+        load_through_dialog(page, character_name)
+        rows = [card.skills_pool.active_count for card in view.ability_score_containers]
+        assert rows == [skill_count] * len(rows), (character_name, rows)
+
+        card = view.ability_score_containers[0]
+        type_into(card.score_field, "17")
+        assert card.modifier_text.value == "+3", card.modifier_text.value
+        type_into(view.header.level_field, "9")
+        type_into(view.header.experience_points_field, "355000")
+        assert view.header.level_field.value == "20", view.header.level_field.value
+
+    print(f"Payload budgets held for {len(CHARACTERS)} loads in strict mode")
+
+if __name__ == "__main__":
+    original_database_file = database.DATABASE_FILE
+    original_monitor_mode = os.environ.get("CHARSHEET_PAYLOAD_MONITOR")
+    with tempfile.TemporaryDirectory() as work_dir:
+        database.DATABASE_FILE = os.path.join(work_dir, "dnd5e.db")
+        shutil.copy(SOURCE_DB, database.DATABASE_FILE)
+        try:
+            run_checks()
+        finally:
+            database.DATABASE_FILE = original_database_file
+            if original_monitor_mode is None:
+                os.environ.pop("CHARSHEET_PAYLOAD_MONITOR", None)
+            else:
+                os.environ["CHARSHEET_PAYLOAD_MONITOR"] = original_monitor_mode
@@ -1,11 +1,17 @@
+# Run from the project root: python -m testpages.TEST_StatCalc
+# (Imports are absolute from the project root, like main_flet.py; the old ToolBase/pagebase host is not part of this repo.)
 import tkinter as tk
 from tkinter import ttk
-from ..views.pagebase import ToolBase
+from core.state_store import StateStore
+from models import rules
 
-class StatCalculator(ToolBase):
+class StatCalculator(ttk.Frame):
     """A tool to demonstrate real-time UI updates without a button press."""
-    def __init__(self, master, app_controller):
-        super().__init__(master, app_controller, "Stat Modifier Calculator")
+    title = "Stat Modifier Calculator"
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.build_ui()
 
     def build_ui(self):
         # --- Variable Setup ---
@@ -15,6 +21,14 @@ class StatCalculator(ToolBase):
         self.stat_score = tk.IntVar(value=10)
         self.modifier_text = tk.StringVar(value="+0")
 
+        # The shared core store does the math (the same code the Flet views use).
+        # None marks an empty/invalid entry.
+        self.store = StateStore()
+        self.store.set("score", 10)
+        self.store.derive("modifier", ["score"], lambda score: rules.modifier_str(score) if score is not None else "...")
+        # When the store's modifier changes, the StringVar (and so the linked Label) follows
+        self.store.subscribe("modifier", self.modifier_text.set)
+
         # 2. "Trace" the stat_score variable.
         # This registers the self.update_modifier function to be called
         # automatically whenever the stat_score variable is written to.
@@ -46,24 +60,20 @@ class StatCalculator(ToolBase):
     def update_modifier(self, *args):
         """
         This function is called automatically whenever self.stat_score changes.
-        It performs the calculation and updates the result variable.
+        It hands the score to the store, which computes the modifier and notifies the StringVar.
         """
         try:
             # Get the current value from the IntVar
             score = self.stat_score.get()
-            
-            # Perform the calculation (e.g., D&D 5e modifier formula)
-            modifier = (score - 10) // 2
-            
-            # Format the result string with a '+' for positive numbers
-            if modifier >= 0:
-                result = f"+{modifier}"
-            else:
-                result = str(modifier)
-            
-            # 5. Update the StringVar, which automatically updates the linked Label.
-            self.modifier_text.set(result)
-
         except tk.TclError:
             # This handles the case where the entry box is empty or invalid
-            self.modifier_text.set("...")
\ No newline at end of file
+            score = None
+
+        # 5. Update the store; its subscription updates the StringVar, which updates the linked Label.
+        self.store.set("score", score)
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title(StatCalculator.title)
+    StatCalculator(root).pack(fill=tk.BOTH, expand=1)
+    root.mainloop()
@@ -0,0 +1,116 @@
+# Runnable check of the incremental sync engine against the LocalSyncServer stand-in.
+# Run from the project root: python -m testpages.TEST_Sync
+# Works on temporary copies of dnd5e.db; the real file is never touched.
+import os
+import shutil
+import tempfile
+from contextlib import closing
+
+import database
+import sync
+from models.character_model import CharacterModel
+
+SOURCE_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dnd5e.db")
+
+def use_device(database_file):
+    """Points the database module (and so CharacterModel) at one device's copy."""
+    database.DATABASE_FILE = database_file
+
+def load(database_file, character_name):
+    use_device(database_file)
+    return CharacterModel(character_name)
+
+def make_newer(database_file, other_database_file):
+    """Moves one device's Lamport clock past another's, so its next edit is the newer change."""
+    with closing(database.get_db_connection(other_database_file)) as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT value FROM sync_meta WHERE key = 'clock'")
+        other_clock = int(cursor.fetchone()['value'])
+    with closing(database.get_db_connection(database_file)) as connection:
+        database.advance_clock(connection.cursor(), other_clock)
+        connection.commit()
+
+def run_checks(work_dir):
+    device_a = os.path.join(work_dir, "device_a.db")
+    device_b = os.path.join(work_dir, "device_b.db")
+    shutil.copy(SOURCE_DB, device_a)
+    shutil.copy(SOURCE_DB, device_b)
+    server = sync.LocalSyncServer()
+    character_name = "bob2"
+
+    # 1. Saving on a copy that never ran init_db() still works (the sync tables are created lazily)
+    model = load(device_a, character_name)
+    model.race = "Elf"
+    assert model.save_character(), "save on an un-initialised database failed"
+
+    # 2. First round: both devices converge on A's edit
+    sync.sync_with_server(server, device_a)
+    report = sync.sync_with_server(server, device_b)
+    assert report['received'] > 0 and not report['conflicts'], report
+    assert load(device_b, character_name).race == "Elf"
+
+    # 3. Concurrent edit of the same field: reported as a conflict, and both copies end up equal
+    model = load(device_a, character_name)
+    model.level = 5
+    model.save_character()
+    model = load(device_b, character_name)
+    model.level = 7
+    model.save_character()
+    sync.sync_with_server(server, device_a)
+    report = sync.sync_with_server(server, device_b)
+    assert [conflict['field'] for conflict in report['conflicts']] == [['level']], report['conflicts']
+    conflict = report['conflicts'][0]
+    assert {conflict['local_value'], conflict['remote_value']} == {5, 7}, conflict
+    sync.sync_with_server(server, device_a)
+    level_a = load(device_a, character_name).level
+    level_b = load(device_b, character_name).level
+    assert level_a == level_b, (level_a, level_b)
+
+    # 4. A removed key (a dropped skill) is removed on the other device too
+    model = load(device_a, character_name)
+    del model.ability_scores["Strength"]["skills"]["Athletics"]
+    model.save_character()
+    sync.sync_with_server(server, device_a)
+    sync.sync_with_server(server, device_b)
+    assert "Athletics" not in load(device_b, character_name).ability_scores["Strength"]["skills"]
+
+    # 5. An edit inside a key another device removed, with the removal as the newer change.
+    #    a) The editing device pushes first: the removing device reports the conflict and keeps its removal.
+    #    b) The removing device pushes first: the editing device reports the conflict and drops the skill.
+    for skill_name, editor_pushes_first in (("Acrobatics", True), ("Stealth", False)):
+        model = load(device_b, character_name)
+        model.ability_scores["Dexterity"]["skills"][skill_name]["proficient"] = True
+        model.save_character()
+        make_newer(device_a, device_b)
+        model = load(device_a, character_name)
+        del model.ability_scores["Dexterity"]["skills"][skill_name]
+        model.save_character()
+
+        first, second = (device_b, device_a) if editor_pushes_first else (device_a, device_b)
+        sync.sync_with_server(server, first)
+        report = sync.sync_with_server(server, second)
+        field = ["abilities", "Dexterity", "skills", skill_name, "proficient"]
+        assert [conflict['field'] for conflict in report['conflicts']] == [field], report['conflicts']
+        assert report['conflicts'][0]['winner'] == ("local" if editor_pushes_first else "remote"), report['conflicts']
+        for _ in range(2):
+            for device in (device_a, device_b):
+                report = sync.sync_with_server(server, device)
+                assert not report['conflicts'], report['conflicts']
+        for device in (device_a, device_b):
+            assert skill_name not in load(device, character_name).ability_scores["Dexterity"]["skills"], (device, skill_name)
+
+    # 6. Fully converged: the whole sheet matches on both devices
+    use_device(device_a)
+    sheet_a = database.load_character(character_name)
+    use_device(device_b)
+    sheet_b = database.load_character(character_name)
+    assert sheet_a == sheet_b, (sheet_a, sheet_b)
+    print(f"Sync checks passed (final level {level_a}, conflict winner: {conflict['winner']})")
+
+if __name__ == "__main__":
+    original_database_file = database.DATABASE_FILE
+    with tempfile.TemporaryDirectory() as work_dir:
+        try:
+            run_checks(work_dir)
+        finally:
+            use_device(original_database_file)
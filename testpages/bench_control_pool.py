@@ -0,0 +1,94 @@
+# Benchmark: switching characters by rebuilding the sheet vs. re-binding pooled skill rows (ControlPool).
+# Run from the project root: python -m testpages.bench_control_pool
+# Both sides run the real load-to-render path on an offline page (testpages/offline_page.py): building or
+# binding the controls, update(), and serializing everything that would be sent to the client.
+# A PayloadMonitor counts the patches and bytes each switch ships. Only the client's own redraw is left out.
+# One untimed warm-up round runs first, so the pool has grown to its largest list before timing starts.
+import time
+from core.character_state import create_character_store, load_model_into_store
+from models.character_model import CharacterModel
+from testpages.offline_page import make_offline_page
+from views.character_sheet_view import CharacterSheetView
+from views.payload_monitor import PayloadMonitor
+
+def make_character(name, skill_count):
+    """Builds a character whose every ability has `skill_count` skills, alternating proficiency."""
+    model = CharacterModel()
+    model.charactername = name
+    for ability_name, ability_data in model.ability_scores.items():
+        ability_data["skills"] = {f"{name} {ability_name} skill {i}": {"proficient": i % 2 == 0} for i in range(skill_count)}
+    return model
+
+def make_sheet_page(model):
+    """Returns (page, monitor, store, view) with the sheet for model already shown."""
+    page = make_offline_page()
+    monitor = PayloadMonitor()
+    monitor.attach(page)
+    store = create_character_store(model)
+    view = CharacterSheetView(model, None, None, store)
+    page.add(view)
+    return page, monitor, store, view
+
+def run_switches(characters, rounds, monitor, switch_to):
+    """Calls switch_to(model) for every character, `rounds` times over. Returns (seconds, shipped totals)."""
+    totals = {'patches': 0, 'bytes': 0}
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for model in characters:
+            with monitor.measure("switch") as switch:
+                switch_to(model)
+            totals['patches'] += switch['patches']
+            totals['bytes'] += switch['bytes']
+    return time.perf_counter() - start, totals
+
+def bench_rebuild(characters, rounds):
+    """Old behaviour: a brand new sheet (every card and skill row) per character switch, sent to the client in full."""
+    page, monitor, store, view = make_sheet_page(characters[0])
+
+    def switch_to(model):
+        page.controls[0].unbind_store() # The old sheet is discarded
+        load_model_into_store(store, model)
+        page.controls[0] = CharacterSheetView(model, None, None, store)
+        page.update()
+
+    run_switches(characters, 1, monitor, switch_to)
+    return run_switches(characters, rounds, monitor, switch_to)
+
+def bench_pooled(characters, rounds):
+    """New behaviour: one sheet whose skill rows are re-bound, grown or hidden, as main_flet's load does."""
+    page, monitor, store, view = make_sheet_page(characters[0])
+
+    def pooled_rows():
+        return sum(len(card.skills_column.controls) for card in view.ability_score_containers)
+
+    def switch_to(model):
+        load_model_into_store(store, model)
+        view.header.update_header_data(model)
+        for card in view.ability_score_containers:
+            ability_data = model.ability_scores[card.ability_name]
+            card.update_card_data(new_score=ability_data["score"], new_skills_data=ability_data["skills"])
+
+    rows_at_start = pooled_rows()
+    run_switches(characters, 1, monitor, switch_to)
+    rows_after_warm_up = pooled_rows()
+    elapsed, totals = run_switches(characters, rounds, monitor, switch_to)
+    return elapsed, totals, rows_after_warm_up - rows_at_start, pooled_rows() - rows_after_warm_up
+
+def print_result(label, elapsed, totals, switches):
+    print(f"{label:<9}{elapsed:.3f}s ({elapsed / switches * 1000:.2f} ms per switch), "
+          f"{totals['patches'] / switches:.0f} patches and {totals['bytes'] / switches / 1024:.1f} KB shipped per switch")
+
+if __name__ == "__main__":
+    # Characters of varying list length, like switching between a new and a high-level character
+    skill_counts = (5, 200, 50, 500, 20)
+    characters = [make_character(f"Character {index}", count) for index, count in enumerate(skill_counts)]
+    rounds = 4
+    switches = rounds * len(characters)
+
+    rebuild_time, rebuild_totals = bench_rebuild(characters, rounds)
+    pooled_time, pooled_totals, grown, created = bench_pooled(characters, rounds)
+
+    print(f"{switches} character switches, 6 abilities with up to {max(skill_counts)} skill rows each")
+    print_result("Rebuild:", rebuild_time, rebuild_totals, switches)
+    print_result("Pooled:", pooled_time, pooled_totals, switches)
+    print(f"Pooled: {grown} rows created while warming up, {created} while timed")
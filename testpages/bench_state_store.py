@@ -0,0 +1,53 @@
+# Benchmark: cost of StateStore notification fan-out, and how often the derived calculation runs.
+# Run from the project root: python -m testpages.bench_state_store
+import time
+from core.state_store import StateStore
+from models import rules
+
+def build_store(observer_count):
+    """A store with one score, its derived modifier, and observer_count widgets-like subscribers."""
+    store = StateStore()
+    calls = {'compute': 0, 'notify': 0}
+
+    def compute(score):
+        calls['compute'] += 1
+        return rules.modifier_str(score)
+
+    def observer(value):
+        calls['notify'] += 1
+
+    store.set("score", 10)
+    store.derive("modifier", ["score"], compute)
+    for _ in range(observer_count):
+        store.subscribe("modifier", observer)
+    calls['compute'] = 0
+    return store, calls
+
+def bench_fan_out(observer_count, changes):
+    """Each change moves the modifier, so every observer is notified every time."""
+    store, calls = build_store(observer_count)
+    start = time.perf_counter()
+    for i in range(changes):
+        store.set("score", 1 + (i % 15) * 2) # Odd steps of 2 always change the modifier
+    return time.perf_counter() - start, calls
+
+def bench_batched(observer_count, changes, batch_size):
+    """The same changes grouped into batches: one calculation and one notification per batch."""
+    store, calls = build_store(observer_count)
+    start = time.perf_counter()
+    for batch_start in range(0, changes, batch_size):
+        with store.batch():
+            for i in range(batch_start, min(batch_start + batch_size, changes)):
+                store.set("score", 1 + (i % 15) * 2)
+    return time.perf_counter() - start, calls
+
+if __name__ == "__main__":
+    changes = 10000
+    print(f"{changes} score changes")
+    for observer_count in (1, 10, 100, 1000):
+        elapsed, calls = bench_fan_out(observer_count, changes)
+        print(f"{observer_count:>5} observers: {elapsed / changes * 1e6:8.2f} us per change, "
+              f"{calls['compute']} calculations, {calls['notify']} notifications")
+    elapsed, calls = bench_batched(100, changes, batch_size=10)
+    print(f"  100 observers, batches of 10: {elapsed / changes * 1e6:8.2f} us per change, "
+          f"{calls['compute']} calculations, {calls['notify']} notifications")
@@ -0,0 +1,29 @@
+# A Flet page with no client attached, for runnable checks and benchmarks that need real update() calls.
+# Every batch of commands is answered the way the Flet client would, so controls get ids and serialize
+# exactly as in the app, but nothing is drawn. Attach a PayloadMonitor to see what would have been shipped.
+import asyncio
+import itertools
+
+import flet as ft
+from flet.core.connection import Connection
+from flet.core.protocol import PageCommandsBatchResponsePayload
+
+class OfflineConnection(Connection):
+    """Accepts command batches and hands back fresh control ids for every 'add', like the client does."""
+    def __init__(self):
+        super().__init__()
+        self._control_ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        results = []
+        for command in commands:
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._control_ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return None
+
+def make_offline_page() -> ft.Page:
+    """Returns a page backed by an OfflineConnection, ready for main(page) or page.add()."""
+    return ft.Page(OfflineConnection(), "offline", asyncio.new_event_loop())
@@ -1,7 +1,10 @@
 import flet as ft
+from core.character_state import modifier_key, score_key
+from core.state_store import StateStore
+from views.control_pool import ControlPool
 
 class AbilityScoreContainer(ft.Container):
-    def __init__(self, ability_name: str, initial_score: int, skills_data: dict, on_score_change):
+    def __init__(self, ability_name: str, skills_data: dict, on_score_change, store: StateStore):
         super().__init__(
             padding=10,
             bgcolor=ft.Colors.LIGHT_GREEN,
@@ -10,30 +13,26 @@ class AbilityScoreContainer(ft.Container):
         )
         self.ability_name = ability_name
         self.on_score_change = on_score_change  # Callback to notify the controller
+
+        # The store owns the score and the modifier math; this card only reads and shows them
+        self.store = store
+        self._unsubscribe_modifier = self.store.subscribe(modifier_key(ability_name), self._on_modifier_change)
         
         # --- Internal UI Elements ---
         self.ability_name_text = ft.Text(ability_name.upper(), size=16, weight=ft.FontWeight.BOLD)
-        self.modifier_text = ft.Text(self._calc_modifier_str(initial_score), size=20)
+        self.modifier_text = ft.Text(self.store.get(modifier_key(ability_name)), size=20)
         self.score_field = ft.TextField(
-            value=str(initial_score),
+            value=str(self.store.get(score_key(ability_name))),
             text_align=ft.TextAlign.CENTER,
             width=100,
             on_change=self._internal_score_change
         )
         
         # --- Build Skills UI ---
-        self.skills_controls = []
-        for skill_name, skill_info in skills_data.items():
-            self.skills_controls.append(
-                ft.Row(
-                    controls=[
-                        # Note: You'll eventually want to add an on_change handler here for the checkbox too!
-                        ft.Checkbox(value=skill_info["proficient"]),
-                        ft.TextField(width=50),
-                        ft.Text(skill_name, selectable=True)
-                    ]
-                )
-            )
+        # Skill rows are pooled so loading another character re-binds them instead of rebuilding
+        self.skills_column = ft.Column()
+        self.skills_pool = ControlPool(self.skills_column, self._create_skill_row, self._bind_skill_row)
+        self.skills_pool.sync(skills_data.items())
             
         # --- Layout ---
         self.content = ft.Row(
@@ -43,14 +42,39 @@ class AbilityScoreContainer(ft.Container):
                     horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                     controls=[self.ability_name_text, self.modifier_text, self.score_field]
                 ),
-                ft.Column(controls=self.skills_controls)
+                self.skills_column
+            ]
+        )
+
+    def _create_skill_row(self) -> ft.Row:
+        """Builds one empty skill row for the pool. Values are filled in by _bind_skill_row."""
+        return ft.Row(
+            controls=[
+                # Note: You'll eventually want to add an on_change handler here for the checkbox too!
+                ft.Checkbox(),
+                ft.TextField(width=50),
+                ft.Text(selectable=True)
             ]
         )
 
-    def _calc_modifier_str(self, score: int) -> str:
-        """Helper to calculate the + or - modifier string."""
-        modifier = (score - 10) // 2
-        return f"+{modifier}" if modifier >= 0 else str(modifier)
+    def _bind_skill_row(self, row: ft.Row, skill_item):
+        """Writes one (skill_name, skill_info) pair into a pooled skill row."""
+        skill_name, skill_info = skill_item
+        checkbox, bonus_field, name_text = row.controls
+        row.data = skill_name
+        checkbox.value = skill_info["proficient"]
+        bonus_field.value = ""
+        name_text.value = skill_name
+
+    def _on_modifier_change(self, modifier: str):
+        """Store subscription. Only sets the value; whoever changed the score redraws the card."""
+        self.modifier_text.value = modifier
+
+    def unbind_store(self):
+        """Stops listening to the store. Call when this card is discarded, so the store doesn't keep it alive."""
+        if self._unsubscribe_modifier:
+            self._unsubscribe_modifier()
+            self._unsubscribe_modifier = None
 
     def _internal_score_change(self, e: ft.ControlEvent):
         """Handles the text field change internally, updates its own UI, then notifies the controller."""
@@ -62,8 +86,8 @@ class AbilityScoreContainer(ft.Container):
             new_score = 10
             self.score_field.value = str(new_score)
 
-        # 1. Update this specific component's UI instantly
-        self.modifier_text.value = self._calc_modifier_str(new_score)
+        # 1. Update this specific component's UI instantly (the store recomputes the modifier)
+        self.store.set(score_key(self.ability_name), new_score)
         self.update() # ONLY updates this card! Very fast.
         
         # 2. Tell the main controller the data changed so it can update the Model
@@ -73,8 +97,7 @@ class AbilityScoreContainer(ft.Container):
     def update_card_data(self, new_score: int, new_skills_data: dict):
         """Called by the main controller when loading a character from the database."""
         self.score_field.value = str(new_score)
-        self.modifier_text.value = self._calc_modifier_str(new_score)
-        
-        # TODO: Update the skill checkboxes here based on new_skills_data
+        self.store.set(score_key(self.ability_name), new_score)
+        self.skills_pool.sync(new_skills_data.items())
         
         self.update()
\ No newline at end of file
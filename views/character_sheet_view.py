@@ -1,4 +1,6 @@
 import flet as ft
+from core.character_state import PROFICIENCY_BONUS_KEY, create_character_store
+from core.state_store import StateStore
 from models.character_model import CharacterModel
 from views.ability_score_container import AbilityScoreContainer
 from views.character_header_container import CharacterHeaderContainer
@@ -7,9 +9,11 @@ from views.character_header_container import CharacterHeaderContainer
 
 class CharacterSheetView(ft.Container):
     # 1. Update __init__ to accept the handler functions
-    def __init__(self, model: CharacterModel, on_score_change_handler, on_header_change_handler):
+    def __init__(self, model: CharacterModel, on_score_change_handler, on_header_change_handler, store: StateStore = None):
         super().__init__(expand=True)
         self.model = model
+        # Shared, UI-agnostic state (scores, derived modifiers, level...) that the components bind to
+        self.store = store or create_character_store(model)
         
         # Save the handlers to the class instance so other methods can use them
         self.on_score_change = on_score_change_handler
@@ -38,6 +42,10 @@ class CharacterSheetView(ft.Container):
 
     def _create_second_row_container(self):
         "Builds and returns a container with a row which has 3 Columns"
+        # --- Proficiency Bonus (derived from level by the store) ---
+        self.proficiency_bonus_text = ft.Text(self._format_proficiency_bonus(self.store.get(PROFICIENCY_BONUS_KEY)))
+        self._unsubscribe_proficiency_bonus = self.store.subscribe(PROFICIENCY_BONUS_KEY, self._on_proficiency_bonus_change)
+
         # --- Populate the self.ability_cards list ---
         self.ability_score_containers = self._create_ability_score_containers()
         return ft.Container(
@@ -66,7 +74,8 @@ class CharacterSheetView(ft.Container):
                         bgcolor=ft.Colors.LIGHT_BLUE_ACCENT_200,
                         content=ft.Column(
                             controls=[
-                                ft.Text("AC/HP/Speed")
+                                ft.Text("AC/HP/Speed"),
+                                self.proficiency_bonus_text
                             ]
                         )
                     ),
@@ -85,6 +94,26 @@ class CharacterSheetView(ft.Container):
             )
         )
 
+    def _format_proficiency_bonus(self, bonus: int) -> str:
+        return f"Proficiency Bonus: +{bonus}"
+
+    def _on_proficiency_bonus_change(self, bonus: int):
+        """Store subscription. Level is edited in the header, so nothing else redraws this text; do it here."""
+        self.proficiency_bonus_text.value = self._format_proficiency_bonus(bonus)
+        if self.proficiency_bonus_text.page:
+            self.proficiency_bonus_text.update()
+
+    def unbind_store(self):
+        """
+        Stops this sheet and its ability cards listening to the store. Call when the sheet is discarded,
+        so a store passed in from outside doesn't keep it alive.
+        """
+        if self._unsubscribe_proficiency_bonus:
+            self._unsubscribe_proficiency_bonus()
+            self._unsubscribe_proficiency_bonus = None
+        for card in self.ability_score_containers:
+            card.unbind_store()
+
     def _create_ability_score_containers(self):
         """Builds the ft.Container for each ability score using the AbilityScoreContainer component."""
         containers = []
@@ -94,9 +123,9 @@ class CharacterSheetView(ft.Container):
             # Instantiate our clean new custom component
             card = AbilityScoreContainer(
                 ability_name=ability_name,
-                initial_score=ability_data["score"],
                 skills_data=ability_data["skills"],
-                on_score_change=self.on_score_change # Pass the controller's function down
+                on_score_change=self.on_score_change, # Pass the controller's function down
+                store=self.store
             )
             containers.append(card)
         return containers
\ No newline at end of file
@@ -0,0 +1,42 @@
+import flet as ft
+
+class ControlPool:
+    """
+    Recycles the controls of a variable-length list section (skills, features, spells, inventory...).
+    Switching characters re-binds the existing controls; only the difference in length is
+    added (when the new list is longer) or hidden (when it is shorter). Nothing is ever rebuilt.
+    """
+    def __init__(self, parent: ft.Column, create_control, bind_control):
+        self.parent = parent                  # The Column/Row whose .controls this pool manages
+        self.create_control = create_control  # () -> new control, only called when the pool must grow
+        self.bind_control = bind_control      # (control, item) -> None, writes one item's data into a control
+
+    @property
+    def active_count(self) -> int:
+        """Number of controls currently showing an item."""
+        return sum(1 for control in self.parent.controls if control.visible)
+
+    def sync(self, items) -> int:
+        """
+        Binds items to pooled controls in order, hiding any surplus.
+        Returns how many new controls had to be created.
+        """
+        items = list(items)
+        pooled = self.parent.controls
+        created = 0
+
+        # 1. Grow the pool only by the delta
+        while len(pooled) < len(items):
+            pooled.append(self.create_control())
+            created += 1
+
+        # 2. Re-bind the controls that are in use
+        for control, item in zip(pooled, items):
+            self.bind_control(control, item)
+            control.visible = True
+
+        # 3. Hide (but keep) the leftovers for the next, longer list
+        for control in pooled[len(items):]:
+            control.visible = False
+
+        return created
@@ -0,0 +1,149 @@
+import json
+import threading
+from contextlib import contextmanager
+
+import flet as ft
+from flet.core.protocol import CommandEncoder
+
+class PayloadBudgetExceeded(AssertionError):
+    """Raised in strict (test) mode when an update or interaction ships more than its budget allows."""
+
+
+def count_controls(control: ft.Control) -> int:
+    """Counts a control and every control nested beneath it."""
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+class PayloadMonitor:
+    """
+    Measures what each update() ships to the Flet client: patch (command) count, serialized bytes,
+    and the number of controls in the tree that was updated.
+
+    Every update is recorded under the class name of the control(s) it was called on
+    (e.g. "AbilityScoreContainer"), and also under any handler label active via measure()/track().
+    budgets maps a label to any of 'max_patches', 'max_bytes' and 'max_controls'. Variable-length
+    sections (pooled lists) can add 'max_patches_per_control' / 'max_bytes_per_control', which grow the
+    allowance with the size of the updated tree. In strict mode going over raises PayloadBudgetExceeded,
+    otherwise a warning is printed.
+    """
+    def __init__(self, budgets=None, strict=False):
+        self.budgets = budgets or {}
+        self.strict = strict
+        self.stats = {}  # label -> {'calls', 'patches', 'bytes', 'max_bytes', 'max_controls'}
+        self._stats_lock = threading.Lock()
+        # Flet runs sync handlers on a thread pool, so what's "current" is tracked per thread
+        self._local = threading.local()
+
+    @property
+    def _update_context(self):
+        """(label, control count) of the update() running on this thread. Page.add/insert/remove have no update() call."""
+        return getattr(self._local, 'update_context', ("Page", 0))
+
+    @property
+    def _active_handlers(self):
+        """[(label, totals)] for the handlers currently running on this thread."""
+        if not hasattr(self._local, 'active_handlers'):
+            self._local.active_handlers = []
+        return self._local.active_handlers
+
+    def attach(self, page: ft.Page):
+        """Hooks into page.update() and the page's connection. Call once, after the page is connected."""
+        original_update = page.update
+        connection = page.connection
+        original_send_commands = connection.send_commands
+
+        def update(*controls):
+            # Control.update() calls page.update(self), so this sees every component's own update too
+            previous_context = self._update_context
+            updated = controls or (page,)
+            self._local.update_context = (
+                ", ".join(type(control).__name__ for control in controls) or "Page",
+                sum(count_controls(control) for control in updated),
+            )
+            try:
+                original_update(*controls)
+            finally:
+                self._local.update_context = previous_context
+
+        def send_commands(session_id, commands):
+            # Flet has already applied this update to its own control tree, so the batch must reach the
+            # client even when it is over budget; raising first would leave the page and client out of step
+            result = original_send_commands(session_id, commands)
+            self._record(commands)
+            return result
+
+        page.update = update
+        connection.send_commands = send_commands
+
+    def _record(self, commands):
+        """Adds one batch of commands (i.e. one update) to the stats of every label it belongs to."""
+        label, controls = self._update_context
+        patches = len(commands)
+        size = len(json.dumps(commands, cls=CommandEncoder, separators=(",", ":")).encode("utf-8"))
+
+        self._add_to_stats(label, patches, size, controls)
+        self._check_budget(label, patches, size, controls)
+        for _, totals in self._active_handlers:
+            totals['patches'] += patches
+            totals['bytes'] += size
+            totals['controls'] += controls
+
+    def _add_to_stats(self, label, patches, size, controls):
+        with self._stats_lock:
+            stats = self.stats.setdefault(label, {'calls': 0, 'patches': 0, 'bytes': 0, 'max_bytes': 0, 'max_controls': 0})
+            stats['calls'] += 1
+            stats['patches'] += patches
+            stats['bytes'] += size
+            stats['max_bytes'] = max(stats['max_bytes'], size)
+            stats['max_controls'] = max(stats['max_controls'], controls)
+
+    def _check_budget(self, label, patches, size, controls):
+        """Compares one update (or one whole interaction) against the label's budget, if it has one."""
+        budget = self.budgets.get(label)
+        if not budget:
+            return
+        over = []
+        if 'max_patches' in budget:
+            max_patches = budget['max_patches'] + budget.get('max_patches_per_control', 0) * controls
+            if patches > max_patches:
+                over.append(f"{patches} patches > {max_patches:g}")
+        if 'max_bytes' in budget:
+            max_bytes = budget['max_bytes'] + budget.get('max_bytes_per_control', 0) * controls
+            if size > max_bytes:
+                over.append(f"{size} bytes > {max_bytes:g}")
+        if controls > budget.get('max_controls', controls):
+            over.append(f"{controls} controls > {budget['max_controls']}")
+        if over:
+            message = f"Payload budget exceeded for '{label}' ({controls} controls): {', '.join(over)}"
+            if self.strict:
+                raise PayloadBudgetExceeded(message)
+            print(f"Warning: {message}")
+
+    @contextmanager
+    def measure(self, label):
+        """Groups every update made inside the block into one interaction, checked against label's budget."""
+        totals = {'patches': 0, 'bytes': 0, 'controls': 0}
+        entry = (label, totals)
+        self._active_handlers.append(entry)
+        try:
+            yield totals
+        finally:
+            self._active_handlers.remove(entry)
+        self._add_to_stats(label, totals['patches'], totals['bytes'], totals['controls'])
+        self._check_budget(label, totals['patches'], totals['bytes'], totals['controls'])
+
+    def track(self, label, handler):
+        """Wraps an event handler so each call is measured as one interaction."""
+        def tracked_handler(*args, **kwargs):
+            with self.measure(label):
+                return handler(*args, **kwargs)
+        return tracked_handler
+
+    def report(self):
+        """Returns a printable per-label summary."""
+        lines = [f"{'Label':<30}{'Calls':>8}{'Patches':>10}{'Bytes':>12}{'Max bytes':>12}{'Max controls':>14}"]
+        with self._stats_lock:
+            for label, stats in sorted(self.stats.items()):
+                lines.append(f"{label:<30}{stats['calls']:>8}{stats['patches']:>10}{stats['bytes']:>12}"
+                             f"{stats['max_bytes']:>12}{stats['max_controls']:>14}")
+        return "\n".join(lines)